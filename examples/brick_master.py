@@ -4,12 +4,15 @@
 An example to demonstrate most of the capabilities of the Tinkerforge Master brick.
 """
 import asyncio
+import os
 import warnings
 from decimal import Decimal
 
 from tinkerforge_async.brick_master import BrickMaster
 from tinkerforge_async.ip_connection import IPConnectionAsync
 
+ZERO_CELSIUS = Decimal("273.15")  # 0 °C in K
+
 
 async def process_callbacks(device: BrickMaster) -> None:
     """Prints the callbacks (filtered by id) of the bricklet"""
@@ -212,7 +215,7 @@ async def run_example(master: BrickMaster) -> None:
         print("USB voltage:  ", await master.get_usb_voltage(), "V")
         print("Stack voltage:", await master.get_stack_voltage(), "V")
         print("Stack current:", await master.get_stack_current(), "A")
-        print("Chip temperature:", await master.get_chip_temperature() - Decimal("273.15"), "°C")
+        print("Chip temperature:", await master.get_chip_temperature() - ZERO_CELSIUS, "°C")
 
         print("##################\nCallbacks:")
         await asyncio.gather(
@@ -293,11 +296,14 @@ async def main() -> None:
         await shutdown(tasks)
 
 
-# Report all mistakes managing asynchronous resources.
-warnings.simplefilter("always", ResourceWarning)
+# Set the TF_DEBUG environment variable to enable the asyncio debug mode and to report all mistakes managing
+# asynchronous resources. The debug mode slows down the event loop, so it is disabled by default.
+DEBUG = bool(os.environ.get("TF_DEBUG"))
+if DEBUG:
+    warnings.simplefilter("always", ResourceWarning)
 
-# Start the main loop and run the async loop forever. Turn off the debug parameter for production code.
+# Start the main loop and run the async loop forever.
 try:
-    asyncio.run(main(), debug=True)
+    asyncio.run(main(), debug=DEBUG)
 except KeyboardInterrupt:
     print("Shutting down gracefully.")
@@ -4,6 +4,7 @@
 An example to demonstrate most of the capabilities of the Tinkerforge  Ambient Light Bricklet 2.0.
 """
 import asyncio
+import os
 import warnings
 
 from tinkerforge_async.bricklet_ambient_light_v2 import BrickletAmbientLightV2
@@ -83,11 +84,14 @@ async def main() -> None:
         await shutdown(tasks)
 
 
-# Report all mistakes managing asynchronous resources.
-warnings.simplefilter("always", ResourceWarning)
+# Set the TF_DEBUG environment variable to enable the asyncio debug mode and to report all mistakes managing
+# asynchronous resources. The debug mode slows down the event loop, so it is disabled by default.
+DEBUG = bool(os.environ.get("TF_DEBUG"))
+if DEBUG:
+    warnings.simplefilter("always", ResourceWarning)
 
-# Start the main loop and run the async loop forever. Turn off the debug parameter for production code.
+# Start the main loop and run the async loop forever.
 try:
-    asyncio.run(main(), debug=True)
+    asyncio.run(main(), debug=DEBUG)
 except KeyboardInterrupt:
     print("Shutting down gracefully.")
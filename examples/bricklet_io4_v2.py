@@ -4,6 +4,7 @@
 An example to demonstrate most of the capabilities of the Tinkerforge IO-4 Bricklet 2.0.
 """
 import asyncio
+import os
 import warnings
 from decimal import Decimal
 
@@ -11,6 +12,8 @@ from tinkerforge_async.bricklet_io4_v2 import BrickletIO4V2
 from tinkerforge_async.devices import BrickletWithMCU
 from tinkerforge_async.ip_connection import IPConnectionAsync
 
+ZERO_CELSIUS = Decimal("273.15")  # 0 °C in K
+
 
 async def process_callbacks(device: BrickletIO4V2) -> None:
     """Prints the callbacks (filtered by id) of the bricklet."""
@@ -38,7 +41,7 @@ async def run_example_generic(bricklet: BrickletWithMCU) -> None:
     await bricklet.set_status_led_config(bricklet.LedConfig.SHOW_STATUS)
     print("Current status:", await bricklet.get_status_led_config())
 
-    print("Get Chip temperature:", await bricklet.get_chip_temperature() - Decimal("273.15"), "°C")
+    print("Get Chip temperature:", await bricklet.get_chip_temperature() - ZERO_CELSIUS, "°C")
 
     print("Reset Bricklet")
     await bricklet.reset()
@@ -164,11 +167,14 @@ async def main() -> None:
         await shutdown(tasks)
 
 
-# Report all mistakes managing asynchronous resources.
-warnings.simplefilter("always", ResourceWarning)
+# Set the TF_DEBUG environment variable to enable the asyncio debug mode and to report all mistakes managing
+# asynchronous resources. The debug mode slows down the event loop, so it is disabled by default.
+DEBUG = bool(os.environ.get("TF_DEBUG"))
+if DEBUG:
+    warnings.simplefilter("always", ResourceWarning)
 
-# Start the main loop and run the async loop forever. Turn off the debug parameter for production code.
+# Start the main loop and run the async loop forever.
 try:
-    asyncio.run(main(), debug=True)
+    asyncio.run(main(), debug=DEBUG)
 except KeyboardInterrupt:
     print("Shutting down gracefully.")
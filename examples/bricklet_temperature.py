@@ -4,6 +4,7 @@
 An example to demonstrate most of the capabilities of the Tinkerforge Temperature Bricklet.
 """
 import asyncio
+import os
 import warnings
 
 from tinkerforge_async.bricklet_temperature import BrickletTemperature
@@ -47,47 +48,38 @@ async def run_example(bricklet: BrickletTemperature) -> None:
         callback_task.cancel()
 
 
-async def shutdown(tasks: set[asyncio.Task]) -> None:
-    """Clean up by stopping all consumers"""
-    for task in tasks:
-        task.cancel()
-    await asyncio.gather(*tasks)
-
-
 async def main() -> None:
     """
     The main loop, that will spawn all callback handlers and wait until they are done. There are two callback handlers,
     one waits for the bricklet to connect and runs the demo, the other handles messages sent by the bricklet.
     """
-    tasks = set()
     try:
         # Use the context manager of the ip connection. It will automatically do the cleanup.
         async with IPConnectionAsync(host="127.0.0.1", port=4223) as connection:
-            await connection.enumerate()
-            # Read all enumeration replies, then start the example if we find the correct device
-            async for enumeration_type, device in connection.read_enumeration():  # pylint: disable=unused-variable
-                if isinstance(device, BrickletTemperature):
-                    print(f"Found {device}, running example.")
-                    tasks.add(asyncio.create_task(run_example(device)))
-                    break
-                print(f"Found {device}, but not interested.")
-
-            # Wait for run_example() to finish
-            await asyncio.gather(*tasks)
+            # The task group waits for run_example() to finish and cancels it, if the main loop is stopped
+            async with asyncio.TaskGroup() as task_group:
+                # Collect all enumeration replies, then start the example if we find the correct device
+                for enumeration_type, device in await connection.drain_enumeration():  # pylint: disable=unused-variable
+                    if isinstance(device, BrickletTemperature):
+                        print(f"Found {device}, running example.")
+                        task_group.create_task(run_example(device))
+                        break
+                    print(f"Found {device}, but not interested.")
     except ConnectionRefusedError:
         print("Could not connect to server. Connection refused. Is the brick daemon up?")
     except asyncio.CancelledError:
         print("Stopped the main loop.")
         raise  # It is good practice to re-raise CancelledErrors
-    finally:
-        await shutdown(tasks)
 
 
-# Report all mistakes managing asynchronous resources.
-warnings.simplefilter("always", ResourceWarning)
+# Set the TF_DEBUG environment variable to enable the asyncio debug mode and to report all mistakes managing
+# asynchronous resources. The debug mode slows down the event loop, so it is disabled by default.
+DEBUG = bool(os.environ.get("TF_DEBUG"))
+if DEBUG:
+    warnings.simplefilter("always", ResourceWarning)
 
-# Start the main loop and run the async loop forever. Turn off the debug parameter for production code.
+# Start the main loop and run the async loop forever.
 try:
-    asyncio.run(main(), debug=True)
+    asyncio.run(main(), debug=DEBUG)
 except KeyboardInterrupt:
     print("Shutting down gracefully.")
@@ -4,6 +4,7 @@
 An example to demonstrate most of the capabilities of the Tinkerforge Barometer Bricklet 2.0.
 """
 import asyncio
+import os
 import warnings
 from decimal import Decimal
 
@@ -11,6 +12,8 @@ from tinkerforge_async.bricklet_temperature_v2 import BrickletTemperatureV2
 from tinkerforge_async.devices import BrickletWithMCU
 from tinkerforge_async.ip_connection import IPConnectionAsync
 
+ZERO_CELSIUS = Decimal("273.15")  # 0 °C in K
+
 
 async def process_callbacks(device: BrickletTemperatureV2) -> None:
     """Prints the callbacks (filtered by id) of the bricklet."""
@@ -38,7 +41,7 @@ async def run_example_generic(bricklet: BrickletWithMCU) -> None:
     await bricklet.set_status_led_config(bricklet.LedConfig.SHOW_STATUS)
     print("Current status:", await bricklet.get_status_led_config())
 
-    print("Get Chip temperature:", await bricklet.get_chip_temperature() - Decimal("273.15"), "°C")
+    print("Get Chip temperature:", await bricklet.get_chip_temperature() - ZERO_CELSIUS, "°C")
 
     print("Reset Bricklet")
     await bricklet.reset()
@@ -78,47 +81,42 @@ async def run_example(bricklet: BrickletTemperatureV2) -> None:
         callback_task.cancel()
 
 
-async def shutdown(tasks: set[asyncio.Task]) -> None:
-    """Clean up by stopping all consumers"""
-    for task in tasks:
-        task.cancel()
-    await asyncio.gather(*tasks)
-
-
 async def main() -> None:
     """
     The main loop, that will spawn all callback handlers and wait until they are done. There are two callback handlers,
     one waits for the bricklet to connect and runs the demo, the other handles messages sent by the bricklet.
     """
-    tasks = set()
     try:
         # Use the context manager of the ip connection. It will automatically do the cleanup.
         async with IPConnectionAsync(host="127.0.0.1", port=4223) as connection:
-            await connection.enumerate()
-            # Read all enumeration replies, then start the example if we find the correct device
-            async for enumeration_type, device in connection.read_enumeration():  # pylint: disable=unused-variable
-                if isinstance(device, BrickletTemperatureV2):
+            # The task group waits for run_example() to finish and cancels it, if the main loop is stopped
+            async with asyncio.TaskGroup() as task_group:
+                # Collect the enumeration replies of all temperature bricklets and start the example with the first one.
+                # The other devices are filtered out by the connection before a device object is created.
+                for enumeration_type, device in await connection.drain_enumeration(  # pylint: disable=unused-variable
+                    device_ids={BrickletTemperatureV2.DEVICE_IDENTIFIER}
+                ):
+                    assert isinstance(device, BrickletTemperatureV2)
                     print(f"Found {device}, running example.")
-                    tasks.add(asyncio.create_task(run_example(device)))
+                    task_group.create_task(run_example(device))
                     break
-                print(f"Found {device}, but not interested.")
-
-            # Wait for run_example() to finish
-            await asyncio.gather(*tasks)
+                else:
+                    print("No Temperature Bricklet 2.0 found.")
     except ConnectionRefusedError:
         print("Could not connect to server. Connection refused. Is the brick daemon up?")
     except asyncio.CancelledError:
         print("Stopped the main loop.")
         raise  # It is good practice to re-raise CancelledErrors
-    finally:
-        await shutdown(tasks)
 
 
-# Report all mistakes managing asynchronous resources.
-warnings.simplefilter("always", ResourceWarning)
+# Set the TF_DEBUG environment variable to enable the asyncio debug mode and to report all mistakes managing
+# asynchronous resources. The debug mode slows down the event loop, so it is disabled by default.
+DEBUG = bool(os.environ.get("TF_DEBUG"))
+if DEBUG:
+    warnings.simplefilter("always", ResourceWarning)
 
-# Start the main loop and run the async loop forever. Turn off the debug parameter for production code.
+# Start the main loop and run the async loop forever.
 try:
-    asyncio.run(main(), debug=True)
+    asyncio.run(main(), debug=DEBUG)
 except KeyboardInterrupt:
     print("Shutting down gracefully.")
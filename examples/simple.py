@@ -4,6 +4,7 @@
 A simple example, that reads a value from a temperature bricklet.
 """
 import asyncio
+import os
 
 from tinkerforge_async import base58decode  # pylint: disable=unused-import # uncomment below to use base58 encoded uids
 from tinkerforge_async.bricklet_temperature_v2 import BrickletTemperatureV2
@@ -23,8 +24,9 @@ async def main() -> None:
         print("Could not connect to server. Connection refused. Is the brick daemon up?")
 
 
-# Start the main loop and run the async loop forever. Turn off the debug parameter for production code.
+# Start the main loop and run the async loop forever. Set the TF_DEBUG environment variable to enable the asyncio debug
+# mode.
 try:
-    asyncio.run(main(), debug=True)
+    asyncio.run(main(), debug=bool(os.environ.get("TF_DEBUG")))
 except KeyboardInterrupt:
     print("Shutting down gracefully.")
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import asyncio
 import re
+import struct
 import warnings
 from decimal import Decimal
 from enum import Enum, unique
@@ -19,11 +20,16 @@ from .devices import BrickletPort as Port
 from .devices import DeviceIdentifier, DeviceWithMCU, Event, GetSPITFPBaudrateConfig, GetSPITFPErrorCount
 from .devices import ThresholdOption as Threshold
 from .devices import _FunctionID
-from .ip_connection_helper import pack_payload, unpack_payload
+from .ip_connection_helper import _compile_format, pack_payload, unpack_payload
 
 if TYPE_CHECKING:
     from .ip_connection import IPConnectionAsync
 
+HOSTNAME_REGEX = re.compile(rb"^(?!-)[a-z0-9-]{2,32}(?<!-)$")  # RFC 1123, but the bricks only allow 32 characters
+SLAVE_ADDRESS_PREFETCH = 8  # Number of slave addresses requested at once when reading the slave address list
+# The client RSSI follows the "! B 4B 4B 4B 6B I I" fields of the Wi-Fi 2.0 status, see get_wifi2_status()
+WIFI2_STATUS_CLIENT_RSSI_OFFSET = _compile_format("! B 4B 4B 4B 6B I I")[0].size
+
 
 class GetChibiErrorLog(NamedTuple):
     underrun: int
@@ -129,52 +135,7 @@ class GetEthernetWebsocketConfiguration(NamedTuple):
 
 
 class ReadWifi2SerialPort(NamedTuple):
-    data: tuple[
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-        int,
-    ]
+    data: bytes
     result: int
 
 
@@ -272,6 +233,24 @@ class GetProtocol1BrickletName(NamedTuple):
     name: bytes
 
 
+class GetAllCallbackPeriods(NamedTuple):
+    stack_current: int
+    stack_voltage: int
+    usb_voltage: int
+
+
+class GetAllCallbackThresholds(NamedTuple):
+    stack_current: BasicCallbackConfiguration
+    stack_voltage: BasicCallbackConfiguration
+    usb_voltage: BasicCallbackConfiguration
+
+
+class GetWifi2MeshStatus(NamedTuple):
+    common_status: GetWifi2MeshCommonStatus
+    client_status: GetWifi2MeshClientStatus
+    ap_status: GetWifi2MeshAPStatus
+
+
 class Wifi2BootloaderError(Exception):
     """
     Raised if the bootloader of the Wi-Fi 2.0 extension did not come up or is
@@ -570,13 +549,27 @@ class EapOptions:
     WifiEapCertType
     """
 
+    # The options are packed into 5 bits. Decode all valid combinations once instead of creating three enums per call.
+    __OPTIONS_BY_VALUE = {
+        outer_auth.value | (inner_auth.value << 2) | (cert_type.value << 3): (outer_auth, inner_auth, cert_type)
+        for outer_auth in WifiEapOuterAuth
+        for inner_auth in WifiEapInnerAuth
+        for cert_type in WifiEapCertType
+    }
+
     def __repr__(self) -> str:
         return f"{self.__outer_auth}, {self.__inner_auth}, {self.__cert_type})"
 
     def __init__(self, value: int) -> None:
-        self.__outer_auth = WifiEapOuterAuth(value & 0b11)
-        self.__inner_auth = WifiEapInnerAuth((value >> 2) & 0b1)
-        self.__cert_type = WifiEapCertType((value >> 3) & 0b11)
+        options = self.__OPTIONS_BY_VALUE.get(value & 0b11111)
+        if options is None:
+            # Decode the fields one by one, so that the enum of the invalid field raises the ValueError
+            options = (
+                WifiEapOuterAuth(value & 0b11),
+                WifiEapInnerAuth((value >> 2) & 0b1),
+                WifiEapCertType((value >> 3) & 0b11),
+            )
+        self.__outer_auth, self.__inner_auth, self.__cert_type = options
 
     @property
     def value(self) -> int:
@@ -912,34 +905,6 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
         )
         return unpack_payload(payload, "B")
 
-    async def __set_chibi_slave_address(self, num: int, address: int, response_expected: bool = True) -> None:
-        """
-        Sets up to 254 slave addresses. Valid addresses are in range 1-255. 0 has a
-        special meaning, it is used as list terminator and not allowed as normal slave
-        address. The address numeration (via ``num`` parameter) has to be used
-        ascending from 0. For example: If you use the Chibi Extension in Master mode
-        (i.e. the stack has an USB connection) and you want to talk to three other
-        Chibi stacks with the slave addresses 17, 23, and 42, you should call with
-        ``(0, 17)``, ``(1, 23)``, ``(2, 42)`` and ``(3, 0)``. The last call with
-        ``(3, 0)`` is a list terminator and indicates that the Chibi slave address
-        list contains 3 addresses in this case.
-
-        It is possible to set the addresses with the Brick Viewer, that will take care
-        of correct address numeration and list termination.
-
-        The slave addresses will be saved in the EEPROM of the Chibi Extension, they
-        don't have to be set on every startup.
-        """
-        assert 0 <= num <= 255
-        assert 0 <= address <= 255
-
-        await self.ipcon.send_request(
-            device=self,
-            function_id=FunctionID.SET_CHIBI_SLAVE_ADDRESS,
-            data=pack_payload((int(num), int(address)), "B B"),
-            response_expected=response_expected,
-        )
-
     async def set_chibi_slave_addresses(
         self, addresses: tuple[int, ...] | list[int], response_expected: bool = True
     ) -> None:
@@ -961,36 +926,42 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
             ]  # add a trailing [0], because it is the delimiter
         assert len(addresses) <= 255
 
-        coros = [
-            self.__set_chibi_slave_address(index, address, response_expected) for index, address in enumerate(addresses)
-        ]
-        await asyncio.gather(*coros)
+        assert all(0 <= address <= 255 for address in addresses)
 
-    async def __get_chibi_slave_address(self, num: int) -> int:
-        """
-        Returns the slave address for a given ``num`` as set by
-        :func:`Set Chibi Slave Address`.
-        """
-        _, payload = await self.ipcon.send_request(
+        await self.ipcon.send_requests(
             device=self,
-            function_id=FunctionID.GET_CHIBI_SLAVE_ADDRESS,
-            data=pack_payload((int(num),), "B"),
-            response_expected=True,
+            function_id=FunctionID.SET_CHIBI_SLAVE_ADDRESS,
+            data=[pack_payload((index, int(address)), "B B") for index, address in enumerate(addresses)],
+            response_expected=response_expected,
         )
 
-        return unpack_payload(payload, "B")
-
     async def get_slave_addresses(self) -> tuple[int, ...]:
         """
         Returns the slave addresses as a tuple.
         """
-        addresses = [await self.__get_chibi_slave_address(0)]
-        index = 1
-        while addresses[-1] != 0:
-            addresses.append(await self.__get_chibi_slave_address(index))
-            index += 1
+        return await self.__get_slave_address_list(FunctionID.GET_CHIBI_SLAVE_ADDRESS)
+
+    async def __get_slave_address_list(self, function_id: _FunctionID) -> tuple[int, ...]:
+        """
+        Reads the slave address list of the Chibi or RS485 Extension, which is terminated by a 0. The addresses are
+        requested in blocks of SLAVE_ADDRESS_PREFETCH to save round trips. The replies following the terminator are
+        discarded.
+        """
+        addresses: list[int] = []
+        for start in range(0, 256, SLAVE_ADDRESS_PREFETCH):
+            replies = await self.ipcon.send_requests(
+                device=self,
+                function_id=function_id,
+                data=[pack_payload((num,), "B") for num in range(start, min(start + SLAVE_ADDRESS_PREFETCH, 256))],
+                response_expected=True,
+            )
+            for _, payload in replies:
+                address = unpack_payload(payload, "B")
+                if address == 0:
+                    return tuple(addresses)  # strip the trailing [0], because it is the delimiter
+                addresses.append(address)
 
-        return tuple(addresses[:-1])
+        return tuple(addresses)
 
     async def get_chibi_signal_strength(self) -> int:
         """
@@ -1012,7 +983,7 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
         _, payload = await self.ipcon.send_request(
             device=self, function_id=FunctionID.GET_CHIBI_ERROR_LOG, response_expected=True
         )
-        return GetChibiErrorLog(*unpack_payload(payload, "H H H H"))
+        return GetChibiErrorLog._make(unpack_payload(payload, "H H H H"))
 
     async def set_chibi_frequency(self, frequency: _ChibiFrequency | int, response_expected: bool = True) -> None:
         """
@@ -1119,31 +1090,6 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
         )
         return unpack_payload(payload, "B")
 
-    async def __set_rs485_slave_address(self, num: int, address: int, response_expected: bool = True) -> None:
-        """
-        Sets up to 255 slave addresses. Valid addresses are in range 1-255. 0 has a special meaning, it is used as list
-        terminator and not allowed as normal slave address. The address numeration (via ``num`` parameter) has to be
-        used ascending from 0. For example: If you use the RS485 Extension in Master mode (i.e. the stack has a USB
-        connection) and you want to talk to three other RS485 stacks with the addresses 17, 23, and 42, you should call
-         with ``(0, 17)``, ``(1, 23)``, ``(2, 42)`` and ``(3, 0)``. The last call with ``(3, 0)`` is a list terminator
-         and indicates that the RS485 slave address list contains 3 addresses in this case.
-
-        It is possible to set the addresses with the Brick Viewer, that will take care of correct address numeration and
-        list termination.
-
-        The slave addresses will be saved in the EEPROM of the Chibi Extension, they don't have to be set on every
-        startup.
-        """
-        assert 0 <= num <= 255
-        assert 0 <= address <= 255
-
-        await self.ipcon.send_request(
-            device=self,
-            function_id=FunctionID.SET_RS485_SLAVE_ADDRESS,
-            data=pack_payload((int(num), int(address)), "B B"),
-            response_expected=response_expected,
-        )
-
     async def set_rs485_slave_addresses(self, addresses: Iterable[int], response_expected: bool = True) -> None:
         """
         Sets up to 255 slave addresses. Valid addresses are in range 1-255. For example: If you use the RS485 Extension
@@ -1161,35 +1107,20 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
             ]  # add a trailing [0], because it is the delimiter
         assert len(addresses) < 255
 
-        coros = [
-            self.__set_rs485_slave_address(index, address, response_expected) for index, address in enumerate(addresses)
-        ]
-        await asyncio.gather(*coros)
+        assert all(0 <= address <= 255 for address in addresses)
 
-    async def __get_rs485_slave_address(self, num: int) -> int:
-        """
-        Returns the slave address for a given ``num`` as set by
-        :func:`Set RS485 Slave Address`.
-        """
-        _, payload = await self.ipcon.send_request(
+        await self.ipcon.send_requests(
             device=self,
-            function_id=FunctionID.GET_RS485_SLAVE_ADDRESS,
-            data=pack_payload((int(num),), "B"),
-            response_expected=True,
+            function_id=FunctionID.SET_RS485_SLAVE_ADDRESS,
+            data=[pack_payload((index, int(address)), "B B") for index, address in enumerate(addresses)],
+            response_expected=response_expected,
         )
 
-        return unpack_payload(payload, "B")
-
     async def get_rs485_slave_addresses(self) -> tuple[int, ...]:
         """
         Returns the slave addresses as a tuple.
         """
-        addresses = [await self.__get_rs485_slave_address(0)]
-        index = 1
-        while addresses[-1] != 0:
-            addresses.append(await self.__get_rs485_slave_address(index))
-            index += 1
-        return tuple(addresses[:-1])  # strip the trailing [0], because it is the delimiter
+        return await self.__get_slave_address_list(FunctionID.GET_RS485_SLAVE_ADDRESS)
 
     async def get_rs485_error_log(self) -> int:
         """
@@ -1311,9 +1242,9 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
                 (
                     ssid,
                     connection.value,
-                    list(map(int, reversed(ip_address))),
-                    list(map(int, reversed(subnet_mask))),
-                    list(map(int, reversed(gateway))),
+                    ip_address[::-1],
+                    subnet_mask[::-1],
+                    gateway[::-1],
                     int(port),
                 ),
                 "32s B 4B 4B 4B H",
@@ -1389,7 +1320,7 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
         if eap_options is None:
             eap_options = EapOptions(0)
         elif not isinstance(eap_options, EapOptions):
-            EapOptions(eap_options)
+            eap_options = EapOptions(eap_options)
         if not isinstance(encryption, WifiEncryptionMode):
             encryption = WifiEncryptionMode(encryption)
         assert 1 <= key_index <= 4
@@ -1501,9 +1432,9 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
             username = username.encode("utf-8")
         assert len(username) <= 32
 
-        data = list(username) + [0] * (32 - len(username))  # pad with null bytes
+        data = username.ljust(32, b"\x00")  # pad with null bytes
 
-        return await self.set_wifi_certificate(0xFFFF, data, len(data), response_expected)
+        return await self.set_wifi_certificate(0xFFFF, data, len(username), response_expected)
 
     async def get_wpa_enterprise_username(self) -> bytes:
         """
@@ -1522,9 +1453,9 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
             password = password.encode("utf-8")
         assert len(password) <= 32
 
-        data = list(password) + [0] * (32 - len(password))  # pad with null bytes
+        data = password.ljust(32, b"\x00")  # pad with null bytes
 
-        return await self.set_wifi_certificate(0xFFFE, data, len(data), response_expected)
+        return await self.set_wifi_certificate(0xFFFE, data, len(password), response_expected)
 
     async def get_wpa_enterprise_password(self) -> bytes:
         """
@@ -1535,7 +1466,7 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
         return bytes(data.data[: data.data_length])
 
     async def set_wifi_certificate(
-        self, index: int, data: Iterable[int], data_length: int, response_expected: bool = True
+        self, index: int, data: bytes | Iterable[int], data_length: int, response_expected: bool = True
     ) -> None:
         """
         This function is used to set the certificate as well as password and username
@@ -1557,16 +1488,19 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
         It is recommended to use the Brick Viewer to set the certificate, username
         and password.
         """
+        data = bytes(data)
+        assert len(data) <= 32
+
         await self.ipcon.send_request(
             device=self,
             function_id=FunctionID.SET_WIFI_CERTIFICATE,
             data=pack_payload(
                 (
                     int(index),
-                    list(map(int, data)),
+                    data,
                     int(data_length),
                 ),
-                "H 32B B",
+                "H 32s B",
             ),
             response_expected=response_expected,
         )
@@ -1583,7 +1517,51 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
             response_expected=True,
         )
 
-        return GetWifiCertificate(*unpack_payload(payload, "32B B"))
+        return GetWifiCertificate._make(unpack_payload(payload, "32B B"))
+
+    async def download_wifi_certificate(self, index: int, length: int) -> bytes:
+        """
+        This is a convenience method, that wraps get_wifi_certificate() to read back a whole certificate of ``length``
+        bytes without worrying about the chunks. The chunks are requested back to back instead of waiting for the reply
+        to each chunk. The certificate lengths are returned by :func:`Get Wifi Encryption`.
+
+        The starting ``index`` of the CA Certificate is 0, of the Client Certificate 10000 and for the Private Key
+        20000.
+        """
+        assert index in (0, 10000, 20000)
+        assert 0 <= length <= (4320 if index == 20000 else 1312)
+
+        replies = await self.ipcon.send_requests(
+            device=self,
+            function_id=FunctionID.GET_WIFI_CERTIFICATE,
+            data=[pack_payload((index + chunk_index,), "H") for chunk_index in range((length + 31) // 32)],
+            response_expected=True,
+        )
+        chunks = (GetWifiCertificate._make(unpack_payload(payload, "32B B")) for _, payload in replies)
+        return b"".join(bytes(chunk.data[: chunk.data_length]) for chunk in chunks)
+
+    async def upload_wifi_certificate(self, index: int, certificate: bytes, response_expected: bool = True) -> None:
+        """
+        This is a convenience method, that wraps set_wifi_certificate() to upload a whole certificate without worrying
+        about the chunks. The certificate is split into chunks of 32 bytes, which are sent back to back instead of
+        waiting for the reply to each chunk.
+
+        The starting ``index`` of the CA Certificate is 0, of the Client Certificate 10000 and for the Private Key
+        20000. Maximum sizes are 1312, 1312 and 4320 byte respectively.
+        """
+        assert index in (0, 10000, 20000)
+        assert len(certificate) <= (4320 if index == 20000 else 1312)
+
+        chunks = [certificate[offset : offset + 32] for offset in range(0, len(certificate), 32)]
+        await self.ipcon.send_requests(
+            device=self,
+            function_id=FunctionID.SET_WIFI_CERTIFICATE,
+            data=[
+                pack_payload((index + chunk_index, chunk, len(chunk)), "H 32s B")
+                for chunk_index, chunk in enumerate(chunks)
+            ],
+            response_expected=response_expected,
+        )
 
     async def set_wifi_power_mode(self, mode: WifiPowerMode, response_expected: bool = True) -> None:
         """
@@ -1635,7 +1613,7 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
             device=self, function_id=FunctionID.GET_WIFI_BUFFER_INFO, response_expected=True
         )
 
-        return GetWifiBufferInfo(*unpack_payload(payload, "I H H"))
+        return GetWifiBufferInfo._make(unpack_payload(payload, "I H H"))
 
     async def set_wifi_regulatory_domain(self, domain: WifiDomain, response_expected: bool = True) -> None:
         """
@@ -1736,8 +1714,7 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
         # Allow 0 characters to reset the hostname (this is TF specific)
         hostname = hostname.lower()
         if len(hostname) != 0:
-            allowed = re.compile(rb"^(?!-)[a-z0-9-]{2,32}(?<!-)$")
-            if not bool(allowed.match(hostname)):
+            if HOSTNAME_REGEX.match(hostname) is None:
                 raise ValueError("Invalid hostname")
 
         await self.ipcon.send_request(
@@ -1761,6 +1738,62 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
 
         return unpack_payload(payload, "16s")
 
+    async def __set_callback_period(self, function_id: _FunctionID, period: int, response_expected: bool) -> None:
+        """
+        Sets the period in ms of the periodic callback selected by ``function_id``.
+        """
+        await self.ipcon.send_request(
+            device=self,
+            function_id=function_id,
+            data=pack_payload((int(period),), "I"),
+            response_expected=response_expected,
+        )
+
+    async def __get_callback_period(self, function_id: _FunctionID) -> int:
+        """
+        Returns the period in ms of the periodic callback selected by ``function_id``.
+        """
+        _, payload = await self.ipcon.send_request(device=self, function_id=function_id, response_expected=True)
+
+        return unpack_payload(payload, "I")
+
+    async def __set_callback_threshold(  # pylint: disable=too-many-arguments
+        self,
+        function_id: _FunctionID,
+        option: Threshold | int,
+        minimum: float | Decimal,
+        maximum: float | Decimal,
+        response_expected: bool,
+    ) -> None:
+        """
+        Sets the thresholds of the threshold callback selected by ``function_id``.
+        """
+        if not isinstance(option, Threshold):
+            option = Threshold(option)
+
+        await self.ipcon.send_request(
+            device=self,
+            function_id=function_id,
+            data=pack_payload(
+                (
+                    option.value,
+                    self.__si_to_sensor(minimum),
+                    self.__si_to_sensor(maximum),
+                ),
+                "c H H",
+            ),
+            response_expected=response_expected,
+        )
+
+    async def __get_callback_threshold(self, function_id: _FunctionID) -> BasicCallbackConfiguration:
+        """
+        Returns the thresholds of the threshold callback selected by ``function_id``.
+        """
+        _, payload = await self.ipcon.send_request(device=self, function_id=function_id, response_expected=True)
+
+        option, minimum, maximum = unpack_payload(payload, "c H H")
+        return BasicCallbackConfiguration(Threshold(option), self.__sensor_to_si(minimum), self.__sensor_to_si(maximum))
+
     async def set_stack_current_callback_period(self, period: int, response_expected: bool = True) -> None:
         """
         Sets the period in ms with which the :cb:`Stack Current` callback is triggered periodically. A value of 0 turns
@@ -1772,12 +1805,7 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
 
         .. versionadded:: 2.0.5$nbsp;(Firmware)
         """
-        await self.ipcon.send_request(
-            device=self,
-            function_id=FunctionID.SET_STACK_CURRENT_CALLBACK_PERIOD,
-            data=pack_payload((int(period),), "I"),
-            response_expected=response_expected,
-        )
+        await self.__set_callback_period(FunctionID.SET_STACK_CURRENT_CALLBACK_PERIOD, period, response_expected)
 
     async def get_stack_current_callback_period(self) -> int:
         """
@@ -1785,11 +1813,7 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
 
         .. versionadded:: 2.0.5$nbsp;(Firmware)
         """
-        _, payload = await self.ipcon.send_request(
-            device=self, function_id=FunctionID.GET_STACK_CURRENT_CALLBACK_PERIOD, response_expected=True
-        )
-
-        return unpack_payload(payload, "I")
+        return await self.__get_callback_period(FunctionID.GET_STACK_CURRENT_CALLBACK_PERIOD)
 
     async def set_stack_voltage_callback_period(self, period: int, response_expected: bool = True) -> None:
         """
@@ -1803,12 +1827,7 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
 
         .. versionadded:: 2.0.5$nbsp;(Firmware)
         """
-        await self.ipcon.send_request(
-            device=self,
-            function_id=FunctionID.SET_STACK_VOLTAGE_CALLBACK_PERIOD,
-            data=pack_payload((int(period),), "I"),
-            response_expected=response_expected,
-        )
+        await self.__set_callback_period(FunctionID.SET_STACK_VOLTAGE_CALLBACK_PERIOD, period, response_expected)
 
     async def get_stack_voltage_callback_period(self) -> int:
         """
@@ -1816,11 +1835,7 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
 
         .. versionadded:: 2.0.5$nbsp;(Firmware)
         """
-        _, payload = await self.ipcon.send_request(
-            device=self, function_id=FunctionID.GET_STACK_VOLTAGE_CALLBACK_PERIOD, response_expected=True
-        )
-
-        return unpack_payload(payload, "I")
+        return await self.__get_callback_period(FunctionID.GET_STACK_VOLTAGE_CALLBACK_PERIOD)
 
     async def set_usb_voltage_callback_period(self, period: int, response_expected: bool = True) -> None:
         """
@@ -1833,12 +1848,7 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
 
         .. versionadded:: 2.0.5$nbsp;(Firmware)
         """
-        await self.ipcon.send_request(
-            device=self,
-            function_id=FunctionID.SET_USB_VOLTAGE_CALLBACK_PERIOD,
-            data=pack_payload((int(period),), "I"),
-            response_expected=response_expected,
-        )
+        await self.__set_callback_period(FunctionID.SET_USB_VOLTAGE_CALLBACK_PERIOD, period, response_expected)
 
     async def get_usb_voltage_callback_period(self) -> int:
         """
@@ -1846,11 +1856,7 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
 
         .. versionadded:: 2.0.5$nbsp;(Firmware)
         """
-        _, payload = await self.ipcon.send_request(
-            device=self, function_id=FunctionID.GET_USB_VOLTAGE_CALLBACK_PERIOD, response_expected=True
-        )
-
-        return unpack_payload(payload, "I")
+        return await self.__get_callback_period(FunctionID.GET_USB_VOLTAGE_CALLBACK_PERIOD)
 
     async def set_stack_current_callback_threshold(
         self,
@@ -1878,21 +1884,8 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
 
         .. versionadded:: 2.0.5$nbsp;(Firmware)
         """
-        if not isinstance(option, Threshold):
-            option = Threshold(option)
-
-        await self.ipcon.send_request(
-            device=self,
-            function_id=FunctionID.SET_STACK_CURRENT_CALLBACK_THRESHOLD,
-            data=pack_payload(
-                (
-                    option.value,
-                    self.__si_to_sensor(minimum),
-                    self.__si_to_sensor(maximum),
-                ),
-                "c H H",
-            ),
-            response_expected=response_expected,
+        await self.__set_callback_threshold(
+            FunctionID.SET_STACK_CURRENT_CALLBACK_THRESHOLD, option, minimum, maximum, response_expected
         )
 
     async def get_stack_current_callback_threshold(self) -> BasicCallbackConfiguration:
@@ -1901,16 +1894,7 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
 
         .. versionadded:: 2.0.5$nbsp;(Firmware)
         """
-        _, payload = await self.ipcon.send_request(
-            device=self, function_id=FunctionID.GET_STACK_CURRENT_CALLBACK_THRESHOLD, response_expected=True
-        )
-
-        option, minimum, maximum = unpack_payload(payload, "c H H")
-        return BasicCallbackConfiguration(
-            Threshold(option),
-            Decimal(minimum) / 1000,
-            Decimal(maximum) / 1000,
-        )
+        return await self.__get_callback_threshold(FunctionID.GET_STACK_CURRENT_CALLBACK_THRESHOLD)
 
     async def set_stack_voltage_callback_threshold(
         self,
@@ -1938,21 +1922,8 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
 
         .. versionadded:: 2.0.5$nbsp;(Firmware)
         """
-        if not isinstance(option, Threshold):
-            option = Threshold(option)
-
-        await self.ipcon.send_request(
-            device=self,
-            function_id=FunctionID.SET_STACK_VOLTAGE_CALLBACK_THRESHOLD,
-            data=pack_payload(
-                (
-                    option.value,
-                    self.__si_to_sensor(minimum),
-                    self.__si_to_sensor(maximum),
-                ),
-                "c H H",
-            ),
-            response_expected=response_expected,
+        await self.__set_callback_threshold(
+            FunctionID.SET_STACK_VOLTAGE_CALLBACK_THRESHOLD, option, minimum, maximum, response_expected
         )
 
     async def get_stack_voltage_callback_threshold(self) -> BasicCallbackConfiguration:
@@ -1961,16 +1932,7 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
 
         .. versionadded:: 2.0.5$nbsp;(Firmware)
         """
-        _, payload = await self.ipcon.send_request(
-            device=self, function_id=FunctionID.GET_STACK_VOLTAGE_CALLBACK_THRESHOLD, response_expected=True
-        )
-
-        option, minimum, maximum = unpack_payload(payload, "c H H")
-        return BasicCallbackConfiguration(
-            Threshold(option),
-            Decimal(minimum) / 1000,
-            Decimal(maximum) / 1000,
-        )
+        return await self.__get_callback_threshold(FunctionID.GET_STACK_VOLTAGE_CALLBACK_THRESHOLD)
 
     async def set_usb_voltage_callback_threshold(
         self,
@@ -1998,21 +1960,8 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
 
         .. versionadded:: 2.0.5$nbsp;(Firmware)
         """
-        if not isinstance(option, Threshold):
-            option = Threshold(option)
-
-        await self.ipcon.send_request(
-            device=self,
-            function_id=FunctionID.SET_USB_VOLTAGE_CALLBACK_THRESHOLD,
-            data=pack_payload(
-                (
-                    option.value,
-                    self.__si_to_sensor(minimum),
-                    self.__si_to_sensor(maximum),
-                ),
-                "c H H",
-            ),
-            response_expected=response_expected,
+        await self.__set_callback_threshold(
+            FunctionID.SET_USB_VOLTAGE_CALLBACK_THRESHOLD, option, minimum, maximum, response_expected
         )
 
     async def get_usb_voltage_callback_threshold(self) -> BasicCallbackConfiguration:
@@ -2021,15 +1970,32 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
 
         .. versionadded:: 2.0.5$nbsp;(Firmware)
         """
-        _, payload = await self.ipcon.send_request(
-            device=self, function_id=FunctionID.GET_USB_VOLTAGE_CALLBACK_THRESHOLD, response_expected=True
+        return await self.__get_callback_threshold(FunctionID.GET_USB_VOLTAGE_CALLBACK_THRESHOLD)
+
+    async def get_all_callback_periods(self) -> GetAllCallbackPeriods:
+        """
+        This is a convenience method, that returns the periods of the :cb:`Stack Current`, :cb:`Stack Voltage` and
+        :cb:`USB Voltage` callbacks. The three requests are sent concurrently.
+        """
+        return GetAllCallbackPeriods._make(
+            await asyncio.gather(
+                self.get_stack_current_callback_period(),
+                self.get_stack_voltage_callback_period(),
+                self.get_usb_voltage_callback_period(),
+            )
         )
 
-        option, minimum, maximum = unpack_payload(payload, "c H H")
-        return BasicCallbackConfiguration(
-            Threshold(option),
-            Decimal(minimum) / 1000,
-            Decimal(maximum) / 1000,
+    async def get_all_callback_thresholds(self) -> GetAllCallbackThresholds:
+        """
+        This is a convenience method, that returns the thresholds of the :cb:`Stack Current Reached`,
+        :cb:`Stack Voltage Reached` and :cb:`USB Voltage Reached` callbacks. The three requests are sent concurrently.
+        """
+        return GetAllCallbackThresholds._make(
+            await asyncio.gather(
+                self.get_stack_current_callback_threshold(),
+                self.get_stack_voltage_callback_threshold(),
+                self.get_usb_voltage_callback_threshold(),
+            )
         )
 
     async def set_debounce_period(self, debounce: int = 100, response_expected: bool = True) -> None:
@@ -2133,9 +2099,9 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
             data=pack_payload(
                 (
                     connection.value,
-                    list(map(int, ip_address)),
-                    list(map(int, subnet_mask)),
-                    list(map(int, gateway)),
+                    ip_address,
+                    subnet_mask,
+                    gateway,
                     int(port),
                 ),
                 "B 4B 4B 4B H",
@@ -2174,7 +2140,7 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
             device=self, function_id=FunctionID.GET_ETHERNET_STATUS, response_expected=True
         )
 
-        return GetEthernetStatus(*unpack_payload(payload, "6B 4B 4B 4B I I 32s"))
+        return GetEthernetStatus._make(unpack_payload(payload, "6B 4B 4B 4B I I 32s"))
 
     async def set_ethernet_hostname(self, hostname: bytes | str, response_expected: bool = True):
         """
@@ -2197,8 +2163,7 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
         # Allow 0 characters to reset the hostname (this is TF specific)
         hostname = hostname.lower()
         if len(hostname) != 0:
-            allowed = re.compile(rb"^(?!-)[a-z0-9-]{2,32}(?<!-)$")
-            if not bool(allowed.match(hostname)):
+            if HOSTNAME_REGEX.match(hostname) is None:
                 raise ValueError("Invalid hostname")
 
         await self.ipcon.send_request(
@@ -2225,7 +2190,7 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
         await self.ipcon.send_request(
             device=self,
             function_id=FunctionID.SET_ETHERNET_MAC_ADDRESS,
-            data=pack_payload((list(map(int, mac_address)),), "6B"),
+            data=pack_payload((mac_address,), "6B"),
             response_expected=response_expected,
         )
 
@@ -2276,7 +2241,7 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
             device=self, function_id=FunctionID.GET_ETHERNET_WEBSOCKET_CONFIGURATION, response_expected=True
         )
 
-        return GetEthernetWebsocketConfiguration(*unpack_payload(payload, "B H"))
+        return GetEthernetWebsocketConfiguration._make(unpack_payload(payload, "B H"))
 
     async def set_ethernet_authentication_secret(self, secret: bytes | str, response_expected: bool = True) -> None:
         """
@@ -2428,17 +2393,13 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
         if not isinstance(data, bytes):
             data = data.encode("utf-8")
 
-        data = bytearray(data)
-        assert len(data) <= 60
-
         length = len(data)
-
-        data.extend([0] * (60 - length))  # always send 60 bytes
+        assert length <= 60
 
         _, payload = await self.ipcon.send_request(
             device=self,
             function_id=FunctionID.WRITE_WIFI2_SERIAL_PORT,
-            data=pack_payload((data, length), "60B B"),
+            data=pack_payload((data, length), "60s B"),  # the struct module pads the data to 60 bytes
             response_expected=True,
         )
         result = unpack_payload(payload, "b")
@@ -2467,7 +2428,8 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
             data=pack_payload((int(length),), "B"),
             response_expected=True,
         )
-        return ReadWifi2SerialPort(*unpack_payload(payload, "60B B"))
+        # The data is returned as a byte string, there is no need to unpack it byte by byte
+        return ReadWifi2SerialPort(payload[:60], payload[60])
 
     async def set_wifi2_authentication_secret(self, secret: bytes | str, response_expected: bool = True):
         """
@@ -2559,7 +2521,7 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
         assert 0 <= sleep_mode <= 255
         assert 0 <= int(website) <= 255
         if not isinstance(phy_mode, PhyMode):
-            phy_mode = PhyMode(PhyMode)
+            phy_mode = PhyMode(phy_mode)
 
         await self.ipcon.send_request(
             device=self,
@@ -2636,6 +2598,18 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
             ap_connected_count,
         )
 
+    async def get_wifi2_client_rssi(self) -> int:
+        """
+        Returns the RSSI of the Wi-Fi Extension 2.0 client connection in dBm. This is the same value as
+        ``client_rssi`` returned by :func:`Get Wifi2 Status`, but only the RSSI is decoded from the reply.
+
+        .. versionadded:: 2.4.0$nbsp;(Firmware)
+        """
+        _, payload = await self.ipcon.send_request(
+            device=self, function_id=FunctionID.GET_WIFI2_STATUS, response_expected=True
+        )
+        return struct.unpack_from("<b", payload, WIFI2_STATUS_CLIENT_RSSI_OFFSET)[0]
+
     async def set_wifi2_client_configuration(  # pylint: disable=too-many-arguments
         self,
         enable: bool = True,
@@ -2695,11 +2669,11 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
                 (
                     bool(enable),
                     ssid,
-                    list(map(int, ip_address)),
-                    list(map(int, subnet_mask)),
-                    list(map(int, gateway)),
-                    list(map(int, mac_address)),
-                    list(map(int, bssid)),
+                    ip_address,
+                    subnet_mask,
+                    gateway,
+                    mac_address,
+                    bssid,
                 ),
                 "! 32s 4B 4B 4B 6B 6B",
             ),
@@ -2745,8 +2719,7 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
         # a digit or hyphen, which was not allowed in RFC 952 originally
         # The bricks only allow 32 characters as opposed to 63 as per RFC.
         hostname = hostname.lower()
-        allowed = re.compile(rb"^(?!-)[a-z0-9-]{2,32}(?<!-)$")
-        if not bool(allowed.match(hostname)):
+        if HOSTNAME_REGEX.match(hostname) is None:
             raise ValueError("Invalid hostname")
 
         await self.ipcon.send_request(
@@ -2876,13 +2849,13 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
                 (
                     bool(enable),
                     ssid,
-                    list(map(int, ip_address)),
-                    list(map(int, subnet_mask)),
-                    list(map(int, gateway)),
+                    ip_address,
+                    subnet_mask,
+                    gateway,
                     encryption.value,
                     hidden,
                     int(channel),
-                    list(map(int, mac_address)),
+                    mac_address,
                 ),
                 "! 32s 4B 4B 4B B ! B 6B",
             ),
@@ -2990,10 +2963,11 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
         Configure the green status LED of the Wi-Fi Extension 2.0. Alternatively
         you can call enable_wifi2_status_led() and disable_wifi2_status_led().
         """
-        if enabled:  # pylint: disable=no-else-return
-            return await self.enable_wifi2_status_led(response_expected)
-        else:
-            return await self.disable_wifi2_status_led(response_expected)
+        await self.ipcon.send_request(
+            device=self,
+            function_id=FunctionID.ENABLE_WIFI2_STATUS_LED if enabled else FunctionID.DISABLE_WIFI2_STATUS_LED,
+            response_expected=response_expected,
+        )
 
     async def enable_wifi2_status_led(self, response_expected: bool = True) -> None:
         """
@@ -3078,7 +3052,6 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
         assert isinstance(root_subnet_mask, (tuple, list)) and len(root_subnet_mask) == 4
         assert isinstance(root_gateway, (tuple, list)) and len(root_gateway) == 4
         assert isinstance(gateway_ip, (tuple, list)) and len(gateway_ip) == 4
-        assert isinstance(root_gateway, (tuple, list)) and len(root_gateway) == 4
         assert isinstance(router_bssid, (tuple, list)) and len(router_bssid) == 6
         assert isinstance(group_id, (tuple, list)) and len(group_id) == 6
         assert 1 <= gateway_port <= 65535
@@ -3092,13 +3065,13 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
             data=pack_payload(
                 (
                     bool(enable),
-                    list(map(int, root_ip)),
-                    list(map(int, root_subnet_mask)),
-                    list(map(int, root_gateway)),
-                    list(map(int, router_bssid)),
-                    list(map(int, group_id)),
+                    root_ip,
+                    root_subnet_mask,
+                    root_gateway,
+                    router_bssid,
+                    group_id,
                     group_ssid_prefix,
-                    list(map(int, gateway_ip)),
+                    gateway_ip,
                     int(gateway_port),
                 ),
                 "! 4B 4B 4B 6B 6B 16s 4B H",
@@ -3117,29 +3090,7 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
         _, payload = await self.ipcon.send_request(
             device=self, function_id=FunctionID.GET_WIFI2_MESH_CONFIGURATION, response_expected=True
         )
-        (
-            enable,
-            root_ip,
-            root_subnet_mask,
-            root_gateway,
-            router_bssid,
-            group_id,
-            group_ssid_prefix,
-            gateway_ip,
-            gateway_port,
-        ) = unpack_payload(payload, "! 4B 4B 4B 6B 6B 16s 4B H")
-
-        return GetWifi2MeshConfiguration(
-            enable,
-            root_ip,
-            root_subnet_mask,
-            root_gateway,
-            router_bssid,
-            group_id,
-            group_ssid_prefix,
-            gateway_ip,
-            gateway_port,
-        )
+        return GetWifi2MeshConfiguration._make(unpack_payload(payload, "! 4B 4B 4B 6B 6B 16s 4B H"))
 
     async def set_wifi2_mesh_router_ssid(self, ssid: bytes | str, response_expected: bool = True) -> None:
         """
@@ -3256,14 +3207,7 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
         _, payload = await self.ipcon.send_request(
             device=self, function_id=FunctionID.GET_WIFI2_MESH_CLIENT_STATUS, response_expected=True
         )
-        hostname, ip_address, subnet_mask, gateway, mac_address = unpack_payload(payload, "32s 4B 4B 4B 6B")
-        return GetWifi2MeshClientStatus(
-            hostname,
-            ip_address,
-            subnet_mask,
-            gateway,
-            mac_address,
-        )
+        return GetWifi2MeshClientStatus._make(unpack_payload(payload, "32s 4B 4B 4B 6B"))
 
     async def get_wifi2_mesh_ap_status(self) -> GetWifi2MeshAPStatus:
         """
@@ -3276,13 +3220,21 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
         _, payload = await self.ipcon.send_request(
             device=self, function_id=FunctionID.GET_WIFI2_MESH_AP_STATUS, response_expected=True
         )
-        hostname, ip_address, subnet_mask, gateway, mac_address = unpack_payload(payload, "32s 4B 4B 4B 6B")
-        return GetWifi2MeshAPStatus(
-            hostname,
-            ip_address,
-            subnet_mask,
-            gateway,
-            mac_address,
+        return GetWifi2MeshAPStatus._make(unpack_payload(payload, "32s 4B 4B 4B 6B"))
+
+    async def get_wifi2_mesh_status(self) -> GetWifi2MeshStatus:
+        """
+        Requires Wi-Fi Extension 2.0 firmware 2.1.0.
+
+        This is a convenience method, that returns the mesh common, client and AP status of the Wi-Fi Extension 2.0.
+        The three requests are sent concurrently.
+        """
+        return GetWifi2MeshStatus._make(
+            await asyncio.gather(
+                self.get_wifi2_mesh_common_status(),
+                self.get_wifi2_mesh_client_status(),
+                self.get_wifi2_mesh_ap_status(),
+            )
         )
 
     async def set_spitfp_baudrate_config(
@@ -3333,7 +3285,7 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
         _, payload = await self.ipcon.send_request(
             device=self, function_id=FunctionID.GET_SPITFP_BAUDRATE_CONFIG, response_expected=True
         )
-        return GetSPITFPBaudrateConfig(*unpack_payload(payload, "! I"))
+        return GetSPITFPBaudrateConfig._make(unpack_payload(payload, "! I"))
 
     async def get_send_timeout_count(self, communication_method: _ConnectionType | int) -> int:
         """
@@ -3386,7 +3338,7 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
         await self.ipcon.send_request(
             device=self,
             function_id=FunctionID.SET_SPITFP_BAUDRATE,
-            data=pack_payload((bricklet_port.value.encode(), int(baudrate)), "c I"),
+            data=pack_payload((bricklet_port.value, int(baudrate)), "c I"),
             response_expected=response_expected,
         )
 
@@ -3402,7 +3354,7 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
         _, payload = await self.ipcon.send_request(
             device=self,
             function_id=FunctionID.GET_SPITFP_BAUDRATE,
-            data=pack_payload((bricklet_port.value.encode(),), "c"),
+            data=pack_payload((bricklet_port.value,), "c"),
             response_expected=True,
         )
         return unpack_payload(payload, "I")
@@ -3430,10 +3382,10 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
         _, payload = await self.ipcon.send_request(
             device=self,
             function_id=FunctionID.GET_SPITFP_ERROR_COUNT,
-            data=pack_payload((bricklet_port.value.encode(),), "c"),
+            data=pack_payload((bricklet_port.value,), "c"),
             response_expected=True,
         )
-        return GetSPITFPErrorCount(*unpack_payload(payload, "I I I I"))
+        return GetSPITFPErrorCount._make(unpack_payload(payload, "I I I I"))
 
     async def enable_status_led(self, response_expected: bool = True) -> None:
         """
@@ -3490,10 +3442,10 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
         _, payload = await self.ipcon.send_request(
             device=self,
             function_id=FunctionID.GET_PROTOCOL1_BRICKLET_NAME,
-            data=pack_payload((bricklet_port.value.encode(),), "c"),
+            data=pack_payload((bricklet_port.value,), "c"),
             response_expected=True,
         )
-        return GetProtocol1BrickletName(*unpack_payload(payload, "B 3B 40s"))
+        return GetProtocol1BrickletName._make(unpack_payload(payload, "B 3B 40s"))
 
     async def get_chip_temperature(self) -> Decimal:
         """
@@ -3507,7 +3459,7 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
             device=self, function_id=FunctionID.GET_CHIP_TEMPERATURE, response_expected=True
         )
         result = unpack_payload(payload, "h")
-        return Decimal(result) / 10 + Decimal("273.15")
+        return Decimal(result).scaleb(-1) + Decimal("273.15")
 
     # pylint: disable=duplicate-code
     @staticmethod
@@ -3515,7 +3467,8 @@ class BrickMaster(DeviceWithMCU):  # pylint: disable=too-many-public-methods
         """
         Convert to the sensor value to SI units
         """
-        return Decimal(value) / 1000
+        # Shift the exponent instead of dividing by 1000. This is exact and does not require a division.
+        return Decimal(value).scaleb(-3)
 
     @staticmethod
     def __si_to_sensor(value: Decimal | float) -> int:
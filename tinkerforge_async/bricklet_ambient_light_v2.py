@@ -231,9 +231,7 @@ class BrickletAmbientLightV2(Device):
         await self.ipcon.send_request(
             device=self,
             function_id=FunctionID.SET_ILLUMINANCE_CALLBACK_THRESHOLD,
-            data=pack_payload(
-                (option.value.encode("ascii"), self.__si_to_value(minimum), self.__si_to_value(maximum)), "c I I"
-            ),
+            data=pack_payload((option.value, self.__si_to_value(minimum), self.__si_to_value(maximum)), "c I I"),
             response_expected=response_expected,
         )
 
@@ -336,7 +334,7 @@ class BrickletAmbientLightV2(Device):
         """
         Convert to the sensor value to SI units
         """
-        return Decimal(value) / 100
+        return Decimal(value).scaleb(-2)
 
     @staticmethod
     def __si_to_value(value) -> int:
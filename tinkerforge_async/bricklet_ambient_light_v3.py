@@ -164,7 +164,6 @@ class BrickletAmbientLightV3(BrickletWithMCU):
         _, payload = await self.ipcon.send_request(
             device=self, function_id=FunctionID.GET_ILLUMINANCE, response_expected=True
         )
-        print(unpack_payload(payload, "I"))
         return self.__value_to_si(unpack_payload(payload, "I"))
 
     async def set_illuminance_callback_configuration(  # pylint: disable=too-many-arguments
@@ -216,7 +215,7 @@ class BrickletAmbientLightV3(BrickletWithMCU):
                 (
                     int(period),
                     bool(value_has_to_change),
-                    option.value.encode("ascii"),
+                    option.value,
                     self.__si_to_value(minimum),
                     self.__si_to_value(maximum),
                 ),
@@ -294,7 +293,7 @@ class BrickletAmbientLightV3(BrickletWithMCU):
         """
         Convert to the sensor value to SI units
         """
-        return Decimal(value) / 100
+        return Decimal(value).scaleb(-2)
 
     @staticmethod
     def __si_to_value(value: float | Decimal) -> int:
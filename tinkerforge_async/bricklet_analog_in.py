@@ -272,9 +272,7 @@ class BrickletAnalogIn(Device):
         await self.ipcon.send_request(
             device=self,
             function_id=FunctionID.SET_VOLTAGE_CALLBACK_THRESHOLD,
-            data=pack_payload(
-                (option.value.encode("ascii"), self.__si_to_value(minimum), self.__si_to_value(maximum)), "c H H"
-            ),
+            data=pack_payload((option.value, self.__si_to_value(minimum), self.__si_to_value(maximum)), "c H H"),
             response_expected=response_expected,
         )
 
@@ -318,7 +316,7 @@ class BrickletAnalogIn(Device):
         await self.ipcon.send_request(
             device=self,
             function_id=FunctionID.SET_ANALOG_VALUE_CALLBACK_THRESHOLD,
-            data=pack_payload((option.value.encode("ascii"), minimum, maximum), "c H H"),
+            data=pack_payload((option.value, minimum, maximum), "c H H"),
             response_expected=response_expected,
         )
 
@@ -254,7 +254,7 @@ class BrickletBarometer(Device):  # pylint: disable=too-many-public-methods
             function_id=FunctionID.SET_AIR_PRESSURE_CALLBACK_THRESHOLD,
             data=pack_payload(
                 (
-                    option.value.encode("ascii"),
+                    option.value,
                     self.__si_pressure_to_value(minimum),
                     self.__si_pressure_to_value(maximum),
                 ),
@@ -305,7 +305,7 @@ class BrickletBarometer(Device):  # pylint: disable=too-many-public-methods
             function_id=FunctionID.SET_ALTITUDE_CALLBACK_THRESHOLD,
             data=pack_payload(
                 (
-                    option.value.encode("ascii"),
+                    option.value,
                     self.__si_altitude_to_value(minimum),
                     self.__si_altitude_to_value(maximum),
                 ),
@@ -447,7 +447,7 @@ class BrickletBarometer(Device):  # pylint: disable=too-many-public-methods
         _, payload = await self.ipcon.send_request(
             device=self, function_id=FunctionID.GET_AVERAGING, response_expected=True
         )
-        return GetAveraging(*unpack_payload(payload, "B B B"))
+        return GetAveraging._make(unpack_payload(payload, "B B B"))
 
     @staticmethod
     def __value_to_si_altitude(value: int) -> Decimal:
@@ -247,7 +247,7 @@ class BrickletBarometerV2(BrickletWithMCU):  # pylint: disable=too-many-public-m
                 (
                     int(period),
                     bool(value_has_to_change),
-                    option.value.encode("ascii"),
+                    option.value,
                     self.__si_to_air_pressure_sensor(minimum),
                     self.__si_to_air_pressure_sensor(maximum),
                 ),
@@ -329,7 +329,7 @@ class BrickletBarometerV2(BrickletWithMCU):  # pylint: disable=too-many-public-m
                 (
                     int(period),
                     bool(value_has_to_change),
-                    option.value.encode("ascii"),
+                    option.value,
                     self.__si_to_altitude_sensor(minimum),
                     self.__si_to_altitude_sensor(maximum),
                 ),
@@ -413,7 +413,7 @@ class BrickletBarometerV2(BrickletWithMCU):  # pylint: disable=too-many-public-m
                 (
                     int(period),
                     bool(value_has_to_change),
-                    option.value.encode("ascii"),
+                    option.value,
                     self.__si_to_temperature_sensor(minimum),
                     self.__si_to_temperature_sensor(maximum),
                 ),
@@ -472,7 +472,7 @@ class BrickletBarometerV2(BrickletWithMCU):  # pylint: disable=too-many-public-m
             device=self, function_id=FunctionID.GET_MOVING_AVERAGE_CONFIGURATION, response_expected=True
         )
 
-        return GetMovingAverageConfiguration(*unpack_payload(payload, "H H"))
+        return GetMovingAverageConfiguration._make(unpack_payload(payload, "H H"))
 
     async def set_reference_air_pressure(
         self, air_pressure: float | Decimal = Decimal("1013.250"), response_expected: bool = True
@@ -260,9 +260,7 @@ class BrickletHumidity(Device):
         await self.ipcon.send_request(
             device=self,
             function_id=FunctionID.SET_HUMIDITY_CALLBACK_THRESHOLD,
-            data=pack_payload(
-                (option.value.encode("ascii"), self.__si_to_value(minimum), self.__si_to_value(maximum)), "c H H"
-            ),
+            data=pack_payload((option.value, self.__si_to_value(minimum), self.__si_to_value(maximum)), "c H H"),
             response_expected=response_expected,
         )
 
@@ -308,7 +306,7 @@ class BrickletHumidity(Device):
         await self.ipcon.send_request(
             device=self,
             function_id=FunctionID.SET_ANALOG_VALUE_CALLBACK_THRESHOLD,
-            data=pack_payload((option.value.encode("ascii"), int(minimum), int(maximum)), "c H H"),
+            data=pack_payload((option.value, int(minimum), int(maximum)), "c H H"),
             response_expected=response_expected,
         )
 
@@ -230,7 +230,7 @@ class BrickletHumidityV2(BrickletWithMCU):
                 (
                     int(period),
                     bool(value_has_to_change),
-                    option.value.encode("ascii"),
+                    option.value,
                     self.__si_to_humidity_sensor(minimum),
                     self.__si_to_humidity_sensor(maximum),
                 ),
@@ -318,7 +318,7 @@ class BrickletHumidityV2(BrickletWithMCU):
                 (
                     int(period),
                     bool(value_has_to_change),
-                    option.value.encode("ascii"),
+                    option.value,
                     self.__si_to_temperature_sensor(minimum),
                     self.__si_to_temperature_sensor(maximum),
                 ),
@@ -418,7 +418,7 @@ class BrickletHumidityV2(BrickletWithMCU):
             device=self, function_id=FunctionID.GET_MOVING_AVERAGE_CONFIGURATION, response_expected=True
         )
 
-        return GetMovingAverageConfiguration(*unpack_payload(payload, "H H"))
+        return GetMovingAverageConfiguration._make(unpack_payload(payload, "H H"))
 
     async def set_samples_per_second(
         self, sps: _SamplesPerSecond | int = SamplesPerSecond.SPS_1, response_expected: bool = True
@@ -246,7 +246,7 @@ class BrickletIndustrialDualAnalogInV2(BrickletWithMCU):
                     int(channel),
                     int(period),
                     bool(value_has_to_change),
-                    option.value.encode("ascii"),
+                    option.value,
                     self.__si_to_value(minimum),
                     self.__si_to_value(maximum),
                 ),
@@ -325,7 +325,7 @@ class BrickletIndustrialDualAnalogInV2(BrickletWithMCU):
         _, payload = await self.ipcon.send_request(
             device=self, function_id=FunctionID.GET_VOLTAGE_CALLBACK_CONFIGURATION, response_expected=True
         )
-        return SimpleCallbackConfiguration(*unpack_payload(payload, "I !"))
+        return SimpleCallbackConfiguration._make(unpack_payload(payload, "I !"))
 
     async def set_sample_rate(self, rate: _SamplingRate | int, response_expected: bool = True) -> None:
         """
@@ -375,7 +375,7 @@ class BrickletIndustrialDualAnalogInV2(BrickletWithMCU):
             device=self, function_id=FunctionID.GET_CALIBRATION, response_expected=True
         )
 
-        return GetCalibration(*unpack_payload(payload, "2i 2i"))
+        return GetCalibration._make(unpack_payload(payload, "2i 2i"))
 
     async def get_adc_values(self) -> tuple[int, int]:
         """
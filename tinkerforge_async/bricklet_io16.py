@@ -276,7 +276,7 @@ class BrickletIO16(Device):
             data=pack_payload((port.value.encode("ascii"),), "c"),
             response_expected=True,
         )
-        return GetPortConfiguration(*unpack_payload(payload, "B B"))
+        return GetPortConfiguration._make(unpack_payload(payload, "B B"))
 
     async def set_callback_configuration(  # pylint: disable=too-many-arguments,unused-argument
         self,
@@ -407,7 +407,7 @@ class BrickletIO16(Device):
             data=pack_payload((port.value.encode("ascii"), pin), "c B"),
             response_expected=True,
         )
-        return GetPortMonoflop(*unpack_payload(payload, "B I I"))
+        return GetPortMonoflop._make(unpack_payload(payload, "B I I"))
 
     async def set_selected_values(
         self, port: _Port | str, selection_mask: int, value_mask: int, response_expected: bool = True
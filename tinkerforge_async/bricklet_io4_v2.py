@@ -344,7 +344,7 @@ class BrickletIO4V2(BrickletWithMCU):
             data=pack_payload((int(channel),), "B"),
             response_expected=True,
         )
-        return SimpleCallbackConfiguration(*unpack_payload(payload, "I !"))
+        return SimpleCallbackConfiguration._make(unpack_payload(payload, "I !"))
 
     async def set_all_input_value_callback_configuration(
         self, period: int = 0, value_has_to_change: bool = False, response_expected: bool = True
@@ -381,7 +381,7 @@ class BrickletIO4V2(BrickletWithMCU):
         _, payload = await self.ipcon.send_request(
             device=self, function_id=FunctionID.GET_ALL_INPUT_VALUE_CALLBACK_CONFIGURATION, response_expected=True
         )
-        return SimpleCallbackConfiguration(*unpack_payload(payload, "I !"))
+        return SimpleCallbackConfiguration._make(unpack_payload(payload, "I !"))
 
     async def set_monoflop(self, channel: int, value: bool, time: int, response_expected: bool = True) -> None:
         """
@@ -432,7 +432,7 @@ class BrickletIO4V2(BrickletWithMCU):
             data=pack_payload((int(channel),), "B"),
             response_expected=True,
         )
-        return GetMonoflop(*unpack_payload(payload, "! I I"))
+        return GetMonoflop._make(unpack_payload(payload, "! I I"))
 
     async def get_edge_count(self, channel: int, reset_counter: bool = False) -> int:
         """
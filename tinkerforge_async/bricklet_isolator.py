@@ -174,7 +174,7 @@ class BrickletIsolator(BrickletWithMCU):
         _, payload = await self.ipcon.send_request(
             device=self, function_id=FunctionID.GET_SPITFP_BAUDRATE_CONFIG, response_expected=True
         )
-        return GetSPITFPBaudrateConfig(*unpack_payload(payload, "! I"))
+        return GetSPITFPBaudrateConfig._make(unpack_payload(payload, "! I"))
 
     async def set_spitfp_baudrate(self, baudrate: int = 1400000, response_expected: bool = True) -> None:
         """
@@ -206,10 +206,7 @@ class BrickletIsolator(BrickletWithMCU):
         Returns the baudrate, see :func:`Set SPITFP Baudrate`.
         """
         _, payload = await self.ipcon.send_request(
-            device=self,
-            function_id=FunctionID.GET_SPITFP_BAUDRATE,
-            data=pack_payload((), ""),
-            response_expected=True,
+            device=self, function_id=FunctionID.GET_SPITFP_BAUDRATE, response_expected=True
         )
         return unpack_payload(payload, "I")
 
@@ -227,12 +224,9 @@ class BrickletIsolator(BrickletWithMCU):
         * overflow errors.
         """
         _, payload = await self.ipcon.send_request(
-            device=self,
-            function_id=FunctionID.GET_ISOLATOR_SPITFP_ERROR_COUNT,
-            data=pack_payload((), ""),
-            response_expected=True,
+            device=self, function_id=FunctionID.GET_ISOLATOR_SPITFP_ERROR_COUNT, response_expected=True
         )
-        return GetSPITFPErrorCount(*unpack_payload(payload, "I I I I"))
+        return GetSPITFPErrorCount._make(unpack_payload(payload, "I I I I"))
 
     async def set_statistics_callback_configuration(  # pylint: disable=too-many-arguments
         self,
@@ -278,7 +272,7 @@ class BrickletIsolator(BrickletWithMCU):
         _, payload = await self.ipcon.send_request(
             device=self, function_id=FunctionID.GET_STATISTICS_CALLBACK_CONFIGURATION, response_expected=True
         )
-        return SimpleCallbackConfiguration(*unpack_payload(payload, "I !"))
+        return SimpleCallbackConfiguration._make(unpack_payload(payload, "I !"))
 
     async def read_events(
         self,
@@ -183,7 +183,7 @@ class BrickletMoisture(Device):
             function_id=FunctionID.SET_MOISTURE_CALLBACK_THRESHOLD,
             data=pack_payload(
                 (
-                    option.value.encode("ascii"),
+                    option.value,
                     int(minimum),
                     int(maximum),
                 ),
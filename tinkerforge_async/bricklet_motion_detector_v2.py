@@ -160,7 +160,7 @@ class BrickletMotionDetectorV2(BrickletWithMCU):
             device=self, function_id=FunctionID.GET_INDICATOR, response_expected=True
         )
 
-        return GetIndicator(*unpack_payload(payload, "B B B"))
+        return GetIndicator._make(unpack_payload(payload, "B B B"))
 
     async def read_events(
         self,
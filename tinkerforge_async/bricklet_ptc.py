@@ -344,7 +344,7 @@ class BrickletPtc(Device):  # pylint: disable=too-many-public-methods
             function_id=FunctionID.SET_TEMPERATURE_CALLBACK_THRESHOLD,
             data=pack_payload(
                 (
-                    option.value.encode("ascii"),
+                    option.value,
                     self.__si_temperature_to_value(minimum),
                     self.__si_temperature_to_value(maximum),
                 ),
@@ -396,7 +396,7 @@ class BrickletPtc(Device):  # pylint: disable=too-many-public-methods
             function_id=FunctionID.SET_RESISTANCE_CALLBACK_THRESHOLD,
             data=pack_payload(
                 (
-                    option.value.encode("ascii"),
+                    option.value,
                     self.__si_resistance_to_value(minimum),
                     self.__si_resistance_to_value(maximum),
                 ),
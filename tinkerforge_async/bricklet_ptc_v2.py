@@ -274,7 +274,7 @@ class BrickletPtcV2(BrickletWithMCU):
                 (
                     int(period),
                     bool(value_has_to_change),
-                    option.value.encode("ascii"),
+                    option.value,
                     self.__si_temperature_to_value(minimum),
                     self.__si_temperature_to_value(maximum),
                 ),
@@ -362,7 +362,7 @@ class BrickletPtcV2(BrickletWithMCU):
                 (
                     int(period),
                     bool(value_has_to_change),
-                    option.value.encode("ascii"),
+                    option.value,
                     self.__si_resistance_to_value(minimum),
                     self.__si_resistance_to_value(maximum),
                 ),
@@ -497,7 +497,7 @@ class BrickletPtcV2(BrickletWithMCU):
             device=self, function_id=FunctionID.GET_MOVING_AVERAGE_CONFIGURATION, response_expected=True
         )
 
-        return GetMovingAverageConfiguration(*unpack_payload(payload, "H H"))
+        return GetMovingAverageConfiguration._make(unpack_payload(payload, "H H"))
 
     async def set_sensor_connected_callback_configuration(
         self, enabled: bool = False, response_expected: bool = True
@@ -346,7 +346,7 @@ class BrickletRS232V2(BrickletWithMCU):
             device=self, function_id=FunctionID.GET_BUFFER_CONFIG, response_expected=True
         )
 
-        return GetBufferConfig(*unpack_payload(payload, "H H"))
+        return GetBufferConfig._make(unpack_payload(payload, "H H"))
 
     async def get_buffer_status(self) -> GetBufferStatus:
         """
@@ -358,7 +358,7 @@ class BrickletRS232V2(BrickletWithMCU):
             device=self, function_id=FunctionID.GET_BUFFER_STATUS, response_expected=True
         )
 
-        return GetBufferStatus(*unpack_payload(payload, "H H"))
+        return GetBufferStatus._make(unpack_payload(payload, "H H"))
 
     async def get_error_count(self) -> GetErrorCount:
         """
@@ -368,7 +368,7 @@ class BrickletRS232V2(BrickletWithMCU):
             device=self, function_id=FunctionID.GET_ERROR_COUNT, response_expected=True
         )
 
-        return GetErrorCount(*unpack_payload(payload, "I I"))
+        return GetErrorCount._make(unpack_payload(payload, "I I"))
 
     async def set_frame_readable_callback_configuration(
         self, frame_size: int = 0, response_expected: bool = True
@@ -121,7 +121,7 @@ class BrickletSegmentDisplay4x7(Device):
         _, payload = await self.ipcon.send_request(
             device=self, function_id=FunctionID.GET_SEGMENTS, response_expected=True
         )
-        return GetSegments(*unpack_payload(payload, "4B B !"))
+        return GetSegments._make(unpack_payload(payload, "4B B !"))
 
     async def start_counter(  # pylint: disable=too-many-arguments
         self, value_from: int, value_to: int, increment: int = 1, length: int = 1000, response_expected: bool = True
@@ -117,7 +117,7 @@ class BrickletSegmentDisplay4x7V2(BrickletWithMCU):
         _, payload = await self.ipcon.send_request(
             device=self, function_id=FunctionID.GET_SEGMENTS, response_expected=True
         )
-        return GetSegments(*unpack_payload(payload, "4B 2! !"))
+        return GetSegments._make(unpack_payload(payload, "4B 2! !"))
 
     async def set_brightness(self, brightness: int = 7, response_expected: bool = True) -> None:
         """
@@ -202,9 +202,7 @@ class BrickletTemperature(Device):
         await self.ipcon.send_request(
             device=self,
             function_id=FunctionID.SET_TEMPERATURE_CALLBACK_THRESHOLD,
-            data=pack_payload(
-                (option.value.encode("ascii"), self.__si_to_value(minimum), self.__si_to_value(maximum)), "c h h"
-            ),
+            data=pack_payload((option.value, self.__si_to_value(minimum), self.__si_to_value(maximum)), "c h h"),
             response_expected=response_expected,
         )
 
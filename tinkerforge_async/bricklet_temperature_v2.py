@@ -185,7 +185,7 @@ class BrickletTemperatureV2(BrickletWithMCU):
                 (
                     int(period),
                     bool(value_has_to_change),
-                    option.value.encode("ascii"),
+                    option.value,
                     self.__si_to_value(minimum),
                     self.__si_to_value(maximum),
                 ),
@@ -275,7 +275,7 @@ class BrickletThermocoupleV2(BrickletWithMCU):
                 (
                     int(period),
                     bool(value_has_to_change),
-                    option.value.encode("ascii"),
+                    option.value,
                     self.__si_to_value(minimum),
                     self.__si_to_value(maximum),
                 ),
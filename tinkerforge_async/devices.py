@@ -458,7 +458,7 @@ class BrickletWithMCU(DeviceWithMCU):
             device=self, function_id=FunctionID.GET_SPITFP_ERROR_COUNT, response_expected=True
         )
 
-        return GetSPITFPErrorCount(*unpack_payload(payload, "I I I I"))
+        return GetSPITFPErrorCount._make(unpack_payload(payload, "I I I I"))
 
 
 @dataclass
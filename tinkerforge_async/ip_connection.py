@@ -16,7 +16,7 @@ from asyncio import StreamReader, StreamWriter
 from dataclasses import dataclass
 from enum import Enum, Flag, unique
 from types import TracebackType
-from typing import AsyncGenerator, Literal, Type, cast, overload
+from typing import AsyncGenerator, Iterable, Literal, Type, cast, overload
 
 from .device_factory import device_factory
 
@@ -105,6 +105,11 @@ class HeaderPayload:
 
 DEFAULT_WAIT_TIMEOUT = 2.5  # in seconds
 
+# A lookup table to convert the raw function id (uint8) of a packet to a FunctionID. Unknown ids are mapped to None.
+FUNCTION_ID_BY_VALUE: tuple[FunctionID | None, ...] = tuple(
+    {function_id.value: function_id for function_id in FunctionID}.get(value) for value in range(256)
+)
+
 
 class IPConnectionAsync:  # pylint: disable=too-many-instance-attributes
     """
@@ -115,6 +120,7 @@ class IPConnectionAsync:  # pylint: disable=too-many-instance-attributes
     BROADCAST_UID = 0  # The uid used to broadcast enumeration events
 
     HEADER_FORMAT = "<IBBBB"  # little endian (<), uid (I, uint32), size (B, uint8), function id, sequence number, flags
+    HEADER_STRUCT = struct.Struct(HEADER_FORMAT)
 
     @property
     def uid(self) -> int:
@@ -183,6 +189,7 @@ class IPConnectionAsync:  # pylint: disable=too-many-instance-attributes
         self.__reader: StreamReader | None = None
         self.__writer: StreamWriter | None = None
         self.__lock: asyncio.Lock | None = None  # Used by connect()
+        self.__write_buffer: list[bytes] = []  # Packets waiting to be written by __flush_write_buffer()
 
         self.__sequence_number_queue: asyncio.Queue[int] = asyncio.Queue(maxsize=15)
         for i in range(1, 16):
@@ -221,19 +228,19 @@ class IPConnectionAsync:  # pylint: disable=too-many-instance-attributes
         """
         uid: int
         payload_size: int
-        function_id: int | FunctionID  # It is parsed as int, then later converted to FunctionID
+        raw_function_id: int
         options: int
         flags: int | Flags
-        uid, payload_size, function_id, options, flags = struct.unpack_from(IPConnectionAsync.HEADER_FORMAT, data)
-
-        try:
-            function_id = FunctionID(function_id)
-            if function_id in (FunctionID.GET_AUTHENTICATION_NONCE, FunctionID.AUTHENTICATE) and not uid == 1:
-                # Only the special uid 1 can reply with GET_AUTHENTICATION_NONCE or AUTHENTICATE
-                function_id = function_id.value
-        except ValueError:
-            # Do not assign an enum, leave the int
-            pass
+        uid, payload_size, raw_function_id, options, flags = IPConnectionAsync.HEADER_STRUCT.unpack_from(data)
+
+        function_id: int | FunctionID = raw_function_id
+        known_function_id = FUNCTION_ID_BY_VALUE[raw_function_id]
+        # Only the special uid 1 can reply with GET_AUTHENTICATION_NONCE or AUTHENTICATE
+        if known_function_id is not None and (
+            uid == 1 or known_function_id not in (FunctionID.GET_AUTHENTICATION_NONCE, FunctionID.AUTHENTICATE)
+        ):
+            function_id = known_function_id
+        # Otherwise do not assign an enum, leave the int
         # There is no sequence number if it is a callback (sequence_number == 0)
         sequence_number = None if (options >> 4) & 0b1111 == 0 else (options >> 4) & 0b1111
         response_expected = bool(options >> 3 & 0b1)
@@ -251,13 +258,13 @@ class IPConnectionAsync:  # pylint: disable=too-many-instance-attributes
         sequence_number: int, payload_size: int, function_id: int, uid=None, response_expected=False
     ) -> bytes:
         uid = IPConnectionAsync.BROADCAST_UID if uid is None else uid
-        packet_size = payload_size + struct.calcsize(IPConnectionAsync.HEADER_FORMAT)
+        packet_size = payload_size + IPConnectionAsync.HEADER_STRUCT.size
         response_expected = bool(response_expected)
 
         sequence_number_and_options = (sequence_number << 4) | response_expected << 3
 
-        return struct.pack(
-            IPConnectionAsync.HEADER_FORMAT, uid, packet_size, function_id, sequence_number_and_options, Flags.OK.value
+        return IPConnectionAsync.HEADER_STRUCT.pack(
+            uid, packet_size, function_id, sequence_number_and_options, Flags.OK.value
         )
 
     @staticmethod
@@ -314,15 +321,53 @@ class IPConnectionAsync:  # pylint: disable=too-many-instance-attributes
         async for data in self.__event_bus.register(f"/events/{uid}"):
             yield data
 
-    async def read_enumeration(self, uid: int | None = None) -> AsyncGenerator[tuple[EnumerationType, Device], None]:
+    async def read_enumeration(
+        self, uid: int | None = None, *, device_ids: Iterable[DeviceIdentifier] | None = None
+    ) -> AsyncGenerator[tuple[EnumerationType, Device], None]:
+        """
+        Yields the enumeration type and the device object for every enumeration event received. The events can be
+        filtered by `uid` and by a collection of device identifiers (`device_ids`). Events, that do not match the
+        filter, are dropped before a device object is created.
+        """
         data: EnumerationPayload
+        wanted_device_ids = None if device_ids is None else frozenset(device_ids)
         async for data in self.__event_bus.register("/enumerations"):
-            if uid is None or uid == data.uid:
+            if (uid is None or uid == data.uid) and (wanted_device_ids is None or data.device_id in wanted_device_ids):
                 try:
                     yield data.enumeration_type, device_factory.get(self, data.device_id, data.uid)  # type: ignore
                 except ValueError:
                     self.__logger.warning("No driver for device id '%s' found.", data.device_id)
 
+    async def drain_enumeration(
+        self, timeout: float = 0.5, *, device_ids: Iterable[DeviceIdentifier] | None = None
+    ) -> list[tuple[EnumerationType, Device]]:
+        """
+        Broadcasts an enumerate request and returns all enumeration events received within `timeout` seconds as a
+        single list. The events can be filtered by their device identifiers (`device_ids`) like in
+        `read_enumeration()`.
+        """
+        enumerations: list[tuple[EnumerationType, Device]] = []
+
+        async def collect_enumerations() -> None:
+            async for enumeration in self.read_enumeration(device_ids=device_ids):
+                enumerations.append(enumeration)
+
+        collector = asyncio.create_task(collect_enumerations())
+        try:
+            # Give the collector a chance to subscribe to the enumeration events, before sending the request
+            await asyncio.sleep(0)
+            await self.enumerate()
+            await asyncio.sleep(timeout)
+        finally:
+            collector.cancel()
+            try:
+                await collector
+            except asyncio.CancelledError:
+                # We cancelled the collector, so asyncio.CancelledError is expected.
+                pass
+
+        return enumerations
+
     async def enumerate(self) -> None:
         """
         Broadcasts an enumerate request. All devices will respond with their id
@@ -409,7 +454,7 @@ class IPConnectionAsync:  # pylint: disable=too-many-instance-attributes
                 },
             )
 
-            self.__writer.write(request)
+            self.__write(request)
             if response_expected:
                 self.__logger.debug("Waiting for reply for request number %i.", sequence_number)
                 # The future will be resolved by the main_loop() and __process_packet()
@@ -438,6 +483,130 @@ class IPConnectionAsync:  # pylint: disable=too-many-instance-attributes
             self.__sequence_number_queue.put_nowait(sequence_number)
             self.__sequence_number_queue.task_done()
 
+    @overload
+    async def send_requests(
+        self,
+        device: Device | IPConnectionAsync | None,
+        function_id: _FunctionID,
+        data: Iterable[bytes],
+        *,
+        response_expected: Literal[True],
+    ) -> list[tuple[HeaderPayload, bytes]]: ...
+
+    @overload
+    async def send_requests(
+        self,
+        device: Device | IPConnectionAsync | None,
+        function_id: _FunctionID,
+        data: Iterable[bytes],
+        *,
+        response_expected: Literal[False] = ...,
+    ) -> None: ...
+
+    @overload
+    async def send_requests(
+        self,
+        device: Device | IPConnectionAsync | None,
+        function_id: _FunctionID,
+        data: Iterable[bytes],
+        *,
+        response_expected: bool = ...,
+    ) -> list[tuple[HeaderPayload, bytes]] | None: ...
+
+    async def send_requests(
+        self,
+        device: Device | IPConnectionAsync | None,
+        function_id: _FunctionID,
+        data: Iterable[bytes],
+        *,
+        response_expected: bool = False,
+    ) -> list[tuple[HeaderPayload, bytes]] | None:
+        """
+        Creates one request per payload in `data` and sends them to the same function of a device. The requests are
+        sent in batches, limited by the number of free sequence numbers, and each batch is written to the Tinkerforge
+        host using a single write call.
+        Returns: None, if 'response_expected' is *False*, else it will return
+        a list of tuples (header, payload) in the order of the requests.
+        """
+        pending_data = list(data)
+        results: list[tuple[HeaderPayload, bytes]] = []
+        while pending_data:
+            if not self.is_connected:
+                raise NotConnectedError("Tinkerforge IP Connection not connected.")
+
+            # Wait for at least one sequence number, then take all that are currently available
+            sequence_numbers = [await self.__sequence_number_queue.get()]
+            try:  # To make sure, that we return the sequence numbers
+                while len(sequence_numbers) < len(pending_data) and not self.__sequence_number_queue.empty():
+                    sequence_numbers.append(self.__sequence_number_queue.get_nowait())
+                assert self.__writer is not None
+
+                batch, pending_data = pending_data[: len(sequence_numbers)], pending_data[len(sequence_numbers) :]
+                packets = []
+                futures: list[asyncio.Future[tuple[HeaderPayload, bytes]]] = []
+                for sequence_number, payload in zip(sequence_numbers, batch):
+                    packets.append(
+                        self.__create_packet_header(
+                            sequence_number=sequence_number,
+                            payload_size=len(payload),
+                            function_id=function_id.value,
+                            uid=0 if device is None else device.uid,
+                            response_expected=response_expected,
+                        )
+                    )
+                    packets.append(payload)
+                    if response_expected:
+                        # The futures will be resolved by the main_loop() and __process_packet()
+                        future: asyncio.Future[tuple[HeaderPayload, bytes]] = asyncio.Future()
+                        self.__pending_requests[sequence_number] = future
+                        futures.append(future)
+
+                self.__logger.debug(
+                    "Sending %(count)i requests to device %(device)s (%(uid)s) and function %(function_id)s with "
+                    "sequence_numbers %(sequence_numbers)s.",
+                    {
+                        "count": len(batch),
+                        "device": device if device is not None else "all",
+                        "uid": device.uid if device is not None else "all",
+                        "function_id": function_id,
+                        "sequence_numbers": sequence_numbers,
+                    },
+                )
+                self.__write(b"".join(packets))
+                if response_expected:
+                    try:
+                        results += await asyncio.wait_for(asyncio.gather(*futures), self.__timeout)
+                    except asyncio.TimeoutError:
+                        asyncio.create_task(self.disconnect())
+                        raise
+                    finally:
+                        for sequence_number in sequence_numbers:
+                            self.__pending_requests.pop(sequence_number, None)
+                        # Cancel the requests, that were abandoned, if gather() raised an error
+                        for future in futures:
+                            future.cancel()
+            finally:
+                for sequence_number in sequence_numbers:
+                    self.__sequence_number_queue.put_nowait(sequence_number)
+                    self.__sequence_number_queue.task_done()
+
+        return results if response_expected else None
+
+    def __write(self, data: bytes) -> None:
+        """
+        Queue data for sending. All data queued by concurrent requests during the same iteration of the event loop is
+        written to the transport with a single write call.
+        """
+        if not self.__write_buffer:
+            asyncio.get_running_loop().call_soon(self.__flush_write_buffer)
+        self.__write_buffer.append(data)
+
+    def __flush_write_buffer(self) -> None:
+        if self.__write_buffer and self.is_connected:
+            assert self.__writer is not None
+            self.__writer.write(b"".join(self.__write_buffer))
+        self.__write_buffer.clear()
+
     async def __process_packet(  # pylint: disable=too-many-branches
         self, header: HeaderPayload, payload: bytes
     ) -> None:
@@ -449,21 +618,18 @@ class IPConnectionAsync:  # pylint: disable=too-many-instance-attributes
         # Callbacks first, because most packets will be callbacks,
         # so it is more efficient to do them first
         if header.sequence_number is None:
-            try:
-                # Check if it is either an enumeration event
-                header.function_id = FunctionID(header.function_id)
-            except ValueError:
+            # The function id was already converted to a FunctionID by __parse_header(), if it is known
+            if not isinstance(header.function_id, FunctionID):
                 # If we do not know the type of event, try to pass it on to
                 # a listening device
                 self.__event_bus.publish(f"/events/{header.uid}", (header, payload))
-            else:
-                if header.function_id is FunctionID.CALLBACK_ENUMERATE:
-                    decoded_payload = self.__parse_enumerate_payload(payload)
-                    self.__logger.debug(
-                        "Received enumeration: %(header)s - %(payload)s.",
-                        {"header": header, "payload": decoded_payload},
-                    )
-                    self.__event_bus.publish("/enumerations", decoded_payload)
+            elif header.function_id is FunctionID.CALLBACK_ENUMERATE:
+                decoded_payload = self.__parse_enumerate_payload(payload)
+                self.__logger.debug(
+                    "Received enumeration: %(header)s - %(payload)s.",
+                    {"header": header, "payload": decoded_payload},
+                )
+                self.__event_bus.publish("/enumerations", decoded_payload)
         elif header.response_expected:
             try:
                 # Mark the future as done
@@ -496,12 +662,10 @@ class IPConnectionAsync:  # pylint: disable=too-many-instance-attributes
             assert self.__reader is not None
             data: bytes | None = None
             try:
-                data = await self.__reader.readexactly(struct.calcsize(IPConnectionAsync.HEADER_FORMAT))
+                data = await self.__reader.readexactly(IPConnectionAsync.HEADER_STRUCT.size)
                 packet_size, header = self.__parse_header(data)
 
-                payload = await self.__reader.readexactly(
-                    packet_size - struct.calcsize(IPConnectionAsync.HEADER_FORMAT)
-                )
+                payload = await self.__reader.readexactly(packet_size - IPConnectionAsync.HEADER_STRUCT.size)
 
                 yield header, payload
             except (struct.error, ValueError):
@@ -681,6 +845,7 @@ class IPConnectionAsync:  # pylint: disable=too-many-instance-attributes
         # Flush data
         assert self.__writer is not None
         try:
+            self.__flush_write_buffer()
             self.__writer.write_eof()
             await self.__writer.drain()
             self.__writer.close()
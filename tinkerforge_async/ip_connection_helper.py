@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import math
 import struct
+from functools import lru_cache
 from typing import Any
 
 # The following code is taken from the original Tinkerforge ip_connection.py
@@ -26,6 +27,7 @@ def uid64_to_uid32(uid64: int) -> int:
     return uid32
 
 
+@lru_cache(maxsize=512)
 def base58encode(value: int) -> str:
     encoded = ""
 
@@ -37,6 +39,7 @@ def base58encode(value: int) -> str:
     return BASE58[value] + encoded
 
 
+@lru_cache(maxsize=512)
 def base58decode(encoded: str) -> int:
     value = 0
     column_multiplier = 1
@@ -49,85 +52,94 @@ def base58decode(encoded: str) -> int:
     return value
 
 
+@lru_cache(maxsize=256)
+def _compile_format(form: str) -> tuple[struct.Struct, tuple[tuple[str, int | None, int, int], ...]]:
+    """
+    Translate a Tinkerforge format string like "I ! c 4B 32s" into a single compiled struct.Struct and a description of
+    each field (type character, explicit repeat count and its slice of the unpacked values). The result is cached, so
+    every format string is only parsed once.
+    """
+    struct_format_str = "<"
+    fields = []
+    index = 0
+    for format_str in form.split():
+        type_char = format_str.strip("0123456789")
+        count = int(format_str.replace(type_char, "")) if len(format_str) > 1 else None
+        if type_char == "!":
+            # Bools are transferred as bit fields
+            number_of_items = int(math.ceil(count / 8.0)) if count is not None else 1
+            struct_format_str += f"{number_of_items}B"
+        else:
+            number_of_items = 1 if type_char == "s" else (count or 1)
+            struct_format_str += format_str
+        fields.append((type_char, count, index, index + number_of_items))
+        index += number_of_items
+
+    return struct.Struct(struct_format_str), tuple(fields)
+
+
 def pack_payload(data: tuple[Any, ...], form: str) -> bytes:  # pylint: disable=too-many-branches
-    packed = b""
+    compiled_struct, fields = _compile_format(form)
+    values: list[Any] = []
 
-    for format_str, data_unpacked in zip(form.split(" "), data):
-        if "!" in format_str:
-            if len(format_str) > 1:
-                if int(format_str.replace("!", "")) != len(data_unpacked):
+    for (type_char, count, start, stop), data_unpacked in zip(fields, data):
+        if type_char == "!":
+            if count is not None:
+                if count != len(data_unpacked):
                     raise ValueError("Incorrect bool list length")
 
-                packed_bools = [0] * int(math.ceil(len(data_unpacked) / 8.0))
+                packed_bools = [0] * (stop - start)
 
                 for i, bool_value in enumerate(data_unpacked):
                     if bool_value:
                         packed_bools[i // 8] |= 1 << (i % 8)
 
-                packed += struct.pack(f"<{len(packed_bools)}B", *packed_bools)
+                values += packed_bools
             else:
-                packed += struct.pack("<?", data_unpacked)
-        elif "c" in format_str:
-            if len(format_str) > 1:
-                packed += struct.pack("<" + format_str, *list(map(lambda char: bytes([ord(char)]), data_unpacked)))
+                values.append(bool(data_unpacked))
+        elif type_char == "c":
+            if count is not None:
+                values += [bytes([ord(char)]) for char in data_unpacked]
             else:
-                packed += struct.pack("<" + format_str, bytes([ord(data_unpacked)]))
-        elif "s" in format_str:
-            packed += struct.pack("<" + format_str, data_unpacked)
-        elif len(format_str) > 1:
-            packed += struct.pack("<" + format_str, *data_unpacked)
+                values.append(bytes([ord(data_unpacked)]))
+        elif type_char != "s" and count is not None:
+            if count != len(data_unpacked):
+                raise struct.error(f"pack expected {count} items for packing (got {len(data_unpacked)})")
+            values += data_unpacked
         else:
-            packed += struct.pack("<" + format_str, data_unpacked)
+            values.append(data_unpacked)
 
-    return packed
+    return compiled_struct.pack(*values)
 
 
 def unpack_payload(data: bytes, form: str) -> Any:  # pylint: disable=too-many-branches
-    ret = []
     if not form or len(data) == 0:
         return None
 
-    for format_str in form.split(" "):
-        # We need to decode the TF format string to the standard Python format string
-        struct_format_str = format_str
+    compiled_struct, fields = _compile_format(form)
+    values = compiled_struct.unpack_from(data)
+    ret: list[Any] = []
 
-        if "!" in struct_format_str:
-            if len(struct_format_str) > 1:
-                struct_format_str = f"{int(math.ceil(int(struct_format_str.replace('!', '')) / 8.0))}B"
+    for type_char, count, start, stop in fields:
+        if type_char == "!":
+            if count is not None:
+                data_unpacked = tuple(values[start + i // 8] & (1 << (i % 8)) != 0 for i in range(count))
             else:
-                struct_format_str = "B"
-
-        struct_format_str = "<" + struct_format_str
-        length = struct.calcsize(struct_format_str)
-        data_unpacked = struct.unpack(struct_format_str, data[:length])
-
-        if "!" in format_str:
-            temp_array = []
-
-            if len(format_str) > 1:
-                for i in range(int(format_str.replace("!", ""))):
-                    temp_array.append(data_unpacked[i // 8] & (1 << (i % 8)) != 0)
-            else:
-                temp_array.append(data_unpacked[0] != 0)
-
-            data_unpacked = tuple(temp_array)
-
-        if "c" in struct_format_str:
-            if len(data_unpacked) > 1:
-                ret.append(tuple(map(lambda item: chr(ord(item)), data_unpacked)))
-            else:
-                ret.append(chr(ord(data_unpacked[0])))  # type: ignore
-        elif "s" in struct_format_str:
+                data_unpacked = (values[start] != 0,)
+        elif type_char == "c":
+            data_unpacked = tuple(item.decode("latin-1") for item in values[start:stop])
+        elif type_char == "s":
             # convert from byte-array to string, removing all null bytes
-            ret.append(str(data_unpacked[0], "latin-1").partition("\0")[0])  # type: ignore
+            ret.append(str(values[start], "latin-1").partition("\0")[0])
+            continue
+        else:
+            data_unpacked = values[start:stop]
 
-        elif len(data_unpacked) > 1:
+        if len(data_unpacked) > 1:
             ret.append(data_unpacked)
         else:
             ret.append(data_unpacked[0])
 
-        data = data[length:]
-
     if len(ret) == 1:
         return ret[0]
     return ret